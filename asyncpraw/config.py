@@ -117,6 +117,9 @@ class Config:
         self.warn_comment_sort = self._config_boolean(
             self._fetch_default("warn_comment_sort", True)
         )
+        self.max_concurrent_requests = self._fetch_default(
+            "max_concurrent_requests", 64
+        )
         self.kinds = {
             x: self._fetch(f"{x}_kind")
             for x in [
@@ -149,6 +152,7 @@ class Config:
             setattr(self, required_attribute, self._fetch(required_attribute))
 
         for attribute, conversion in {
+            "max_concurrent_requests": int,
             "ratelimit_seconds": int,
             "timeout": int,
         }.items():
@@ -160,3 +164,10 @@ class Config:
                     f" expected type is {conversion.__name__}, but the given value is"
                     f" {getattr(self, attribute)}."
                 )
+
+        if self.max_concurrent_requests < 1:
+            raise ValueError(
+                "An incorrect config value was given for option max_concurrent_requests."
+                " The value must be at least 1, but the given value is"
+                f" {self.max_concurrent_requests}."
+            )
@@ -299,7 +299,7 @@ class MediaPostFailed(WebSocketException):
 
 
 # Adapted from https://stackoverflow.com/a/40546615
-class ExceptionWrapper(object):
+class ExceptionWrapper:
     """Wrapper to facilitate showing depreciation for PRAWException class rename."""
 
     def __init__(self, wrapped):
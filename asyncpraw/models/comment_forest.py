@@ -247,6 +247,12 @@ class CommentForest:
                 item._remove_from.remove(item)
                 continue
 
+            if remaining is None and more_comments:
+                # Every remaining item meeting the threshold is going to be replaced,
+                # so request the next one while this one is awaited and inserted
+                upcoming = more_comments[0]
+                if upcoming.count >= threshold:
+                    upcoming._prefetch(update=False)
             new_comments = await item.comments(update=False)
             if remaining is not None:
                 remaining -= 1
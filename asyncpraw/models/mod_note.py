@@ -1,42 +1,60 @@
-"""Provide the ModAction class."""
+"""Provide the ModNote class."""
 from typing import TYPE_CHECKING, Union
 
 from asyncpraw.models.base import AsyncPRAWBase
 
+from .reddit.redditor import Redditor
+from .reddit.subreddit import Subreddit
+
 if TYPE_CHECKING:  # pragma: no cover
     import asyncpraw
 
 
 class ModNote(AsyncPRAWBase):
-    """Represent a moderator action."""
+    """Represent a moderator note."""
 
     def __str__(self) -> str:
         """Return a string representation of the instance."""
         return getattr(self, "id")
 
     @property
-    async def user(self) :
-        """Return the :class:`.Redditor` who the action was issued by."""
-        return self._reddit.redditor(self._user)  # pylint: disable=no-member
+    def user(self) -> "asyncpraw.models.Redditor":
+        """Return the :class:`.Redditor` who the note is about."""
+        if "_user_object" not in self.__dict__:
+            self._user_object = Redditor(
+                self._reddit, name=self._user  # pylint: disable=no-member
+            )
+        return self._user_object
 
     @user.setter
     def user(self, value: Union[str, "asyncpraw.models.Redditor"]):
         self._user = value  # pylint: disable=attribute-defined-outside-init
+        self.__dict__.pop("_user_object", None)
 
     @property
-    async def operator(self) :
-        """Return the :class:`.Redditor` who the action was issued by."""
-        return self._reddit.redditor(self._operator)  # pylint: disable=no-member
+    def operator(self) -> "asyncpraw.models.Redditor":
+        """Return the :class:`.Redditor` who the note was created by."""
+        if "_operator_object" not in self.__dict__:
+            self._operator_object = Redditor(
+                self._reddit, name=self._operator  # pylint: disable=no-member
+            )
+        return self._operator_object
 
     @operator.setter
     def operator(self, value: Union[str, "asyncpraw.models.Redditor"]):
         self._operator = value  # pylint: disable=attribute-defined-outside-init
+        self.__dict__.pop("_operator_object", None)
 
     @property
-    async def subreddit(self) :
-        """Return the :class:`.Redditor` who the action was issued by."""
-        return self._reddit.subreddit(self._subreddit)  # pylint: disable=no-member
+    def subreddit(self) -> "asyncpraw.models.Subreddit":
+        """Return the :class:`.Subreddit` the note belongs to."""
+        if "_subreddit_object" not in self.__dict__:
+            self._subreddit_object = Subreddit(
+                self._reddit, self._subreddit  # pylint: disable=no-member
+            )
+        return self._subreddit_object
 
     @subreddit.setter
     def subreddit(self, value: Union[str, "asyncpraw.models.Subreddit"]):
-        self._subreddit = value  # pylint: disable=attribute-defined-outside-init
\ No newline at end of file
+        self._subreddit = value  # pylint: disable=attribute-defined-outside-init
+        self.__dict__.pop("_subreddit_object", None)
@@ -304,8 +304,7 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
         else:
             if self._submission is None:
                 await self._fetch()
-            path = API_PATH["submission"].format(id=self.submission.id)
-            comment_path = f"{path}_/{self.id}"
+            comment_path = f"{self.submission._path}_/{self.id}"
 
         # The context limit appears to be 8, but let's ask for more anyway.
         params = {"context": 100}
@@ -1,7 +1,8 @@
 """Provide the MessageableMixin class."""
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Iterable, Optional, Union
 
 from ....const import API_PATH
+from ...util import _gather_bounded
 
 if TYPE_CHECKING:  # pragma: no cover
     import asyncpraw
@@ -10,6 +11,54 @@ if TYPE_CHECKING:  # pragma: no cover
 class MessageableMixin:
     """Interface for classes that can be messaged."""
 
+    MESSAGE_PREFIX = ""
+
+    @staticmethod
+    async def message_many(
+        targets: Iterable[
+            Union["asyncpraw.models.Redditor", "asyncpraw.models.Subreddit"]
+        ],
+        subject: str,
+        message: str,
+        from_subreddit: Optional[Union["asyncpraw.models.Subreddit", str]] = None,
+        max_concurrency: int = 10,
+    ):
+        """Send the same message to several targets concurrently.
+
+        :param targets: The :class:`.Redditor` and/or :class:`.Subreddit` instances to
+            message.
+        :param subject: The subject of the message.
+        :param message: The message content.
+        :param from_subreddit: A :class:`.Subreddit` instance or string to send the
+            messages from (default: ``None``). See :meth:`.message` for details.
+        :param max_concurrency: The maximum number of messages to have in flight at
+            once (default: ``10``).
+
+        If a message fails to send, the remaining messages are still sent and the first
+        exception is raised once they are done.
+
+        .. note::
+
+            Concurrent requests are still subject to Reddit's rate limits. Sending many
+            messages at once may result in a :class:`.RedditAPIException` with a
+            ``RATELIMIT`` error.
+
+        For example, to send the same message to u/spez and u/bboe, try:
+
+        .. code-block:: python
+
+            redditors = [await reddit.redditor(name) for name in ("spez", "bboe")]
+            await Redditor.message_many(redditors, "TEST", "test message")
+
+        """
+        await _gather_bounded(
+            lambda target: target.message(
+                subject, message, from_subreddit=from_subreddit
+            ),
+            targets,
+            max_concurrency,
+        )
+
     async def message(
         self,
         subject: str,
@@ -55,7 +104,7 @@ class MessageableMixin:
         data = {
             "subject": subject,
             "text": message,
-            "to": f"{getattr(self.__class__, 'MESSAGE_PREFIX', '')}{self}",
+            "to": f"{self.MESSAGE_PREFIX}{self}",
         }
         if from_subreddit:
             data["from_sr"] = str(from_subreddit)
@@ -1,10 +1,54 @@
 """Provide the ReplyableMixin class."""
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
+
 from ....const import API_PATH
+from ...util import _gather_bounded
+
+if TYPE_CHECKING:  # pragma: no cover
+    import asyncpraw
 
 
 class ReplyableMixin:
     """Interface for :class:`.RedditBase` classes that can be replied to."""
 
+    @staticmethod
+    async def reply_many(
+        targets: Iterable[
+            Union[
+                "asyncpraw.models.Comment",
+                "asyncpraw.models.Message",
+                "asyncpraw.models.Submission",
+            ]
+        ],
+        body: str,
+        max_concurrency: int = 10,
+    ) -> List[Optional["asyncpraw.models.Comment"]]:
+        r"""Reply to several objects with the same body concurrently.
+
+        :param targets: The objects, such as :class:`.Comment`\ s and
+            :class:`.Submission`\ s, to reply to.
+        :param body: The Markdown formatted content for each comment.
+        :param max_concurrency: The maximum number of replies to have in flight at once
+            (default: ``10``).
+
+        :returns: A list with the result of :meth:`.reply` for each target, in the
+            same order as ``targets``.
+
+        If a reply fails, the remaining replies are still sent and the first exception
+        is raised once they are done.
+
+        Example usage:
+
+        .. code-block:: python
+
+            comments = [await reddit.comment(id) for id in ("dxolpyc", "dxolpyd")]
+            await Comment.reply_many(comments, "reply")
+
+        """
+        return await _gather_bounded(
+            lambda target: target.reply(body), targets, max_concurrency
+        )
+
     async def reply(self, body: str):
         """Reply to the object.
 
@@ -35,7 +79,4 @@ class ReplyableMixin:
         """
         data = {"text": body, "thing_id": self.fullname}
         comments = await self._reddit.post(API_PATH["comment"], data=data)
-        try:
-            return comments[0]
-        except IndexError:  # pragma: no cover; I haven't been able to make this happen again
-            return None
+        return comments[0] if comments else None
@@ -1,10 +1,46 @@
 """Provide the VotableMixin class."""
+from typing import TYPE_CHECKING, Iterable, Union
+
 from ....const import API_PATH
+from ...util import _gather_bounded
+
+if TYPE_CHECKING:  # pragma: no cover
+    import asyncpraw
 
 
 class VotableMixin:
     """Interface for :class:`.RedditBase` classes that can be voted on."""
 
+    @staticmethod
+    async def clear_vote_many(
+        targets: Iterable[
+            Union["asyncpraw.models.Comment", "asyncpraw.models.Submission"]
+        ],
+        max_concurrency: int = 10,
+    ):
+        r"""Clear the authenticated user's votes on several objects concurrently.
+
+        :param targets: The objects, such as :class:`.Comment`\ s and
+            :class:`.Submission`\ s, to clear the vote on.
+        :param max_concurrency: The maximum number of requests to have in flight at
+            once (default: ``10``).
+
+        If a request fails, the remaining requests are still sent and the first
+        exception is raised once they are done.
+
+        Example usage:
+
+        .. code-block:: python
+
+            submission = await reddit.submission("5or86n", fetch=False)
+            comment = await reddit.comment("dxolpyc", fetch=False)
+            await Submission.clear_vote_many([submission, comment])
+
+        """
+        await _gather_bounded(
+            lambda target: target.clear_vote(), targets, max_concurrency
+        )
+
     async def _vote(self, direction):
         await self._reddit.post(
             API_PATH["vote"], data={"dir": str(direction), "id": self.fullname}
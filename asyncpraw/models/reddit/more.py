@@ -1,4 +1,5 @@
 """Provide the MoreComments class."""
+import asyncio
 from typing import TYPE_CHECKING, Any, Dict, List, Union
 
 from ...const import API_PATH
@@ -17,6 +18,7 @@ class MoreComments(AsyncPRAWBase):
         self.children = []
         super().__init__(reddit, _data=_data)
         self._comments = None
+        self._comments_task = None
         self.submission = None
 
     def __eq__(self, other: Union[str, "MoreComments"]) -> bool:
@@ -49,7 +51,7 @@ class MoreComments(AsyncPRAWBase):
         return self._comments
 
     async def _load_comment(self, comment_id):
-        path = f"{API_PATH['submission'].format(id=self.submission.id)}_/{comment_id}"
+        path = f"{self.submission._path}_/{comment_id}"
         _, comments = await self._reddit.get(
             path,
             params={
@@ -60,21 +62,36 @@ class MoreComments(AsyncPRAWBase):
         assert len(comments.children) == 1, "Please file a bug report with Async PRAW."
         return comments.children[0]
 
+    async def _fetch_comments(self, update: bool) -> List["asyncpraw.models.Comment"]:
+        if self.count == 0:  # Handle "continue this thread"
+            return await self._continue_comments(update)
+        assert self.children, "Please file a bug report with Async PRAW."
+        data = {
+            "children": ",".join(self.children),
+            "link_id": self.submission.fullname,
+            "sort": self.submission.comment_sort,
+        }
+        self._comments = await self._reddit.post(API_PATH["morechildren"], data=data)
+        if update:
+            for comment in self._comments:
+                comment.submission = self.submission
+        return self._comments
+
+    def _prefetch(self, update: bool = True):
+        """Start fetching the comments in the background.
+
+        A following call to :meth:`.comments` awaits the started request instead of
+        issuing another one.
+
+        """
+        if self._comments is None and self._comments_task is None:
+            self._comments_task = asyncio.ensure_future(self._fetch_comments(update))
+
     async def comments(self, update: bool = True) -> List["asyncpraw.models.Comment"]:
         """Fetch and return the comments for a single :class:`.MoreComments` object."""
         if self._comments is None:
-            if self.count == 0:  # Handle "continue this thread"
-                return await self._continue_comments(update)
-            assert self.children, "Please file a bug report with Async PRAW."
-            data = {
-                "children": ",".join(self.children),
-                "link_id": self.submission.fullname,
-                "sort": self.submission.comment_sort,
-            }
-            self._comments = await self._reddit.post(
-                API_PATH["morechildren"], data=data
-            )
-            if update:
-                for comment in self._comments:
-                    comment.submission = self.submission
+            if self._comments_task is not None:
+                task, self._comments_task = self._comments_task, None
+                return await task
+            return await self._fetch_comments(update)
         return self._comments
@@ -1,11 +1,14 @@
 """Provide the Multireddit class."""
+import asyncio
 import re
-from json import dumps
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Union
 
 from ...const import API_PATH
 from ...util.cache import cachedproperty
+from ...util.serializer import dumps
 from ..listing.mixins import SubredditListingMixin
+from ..util import _gather_bounded
 from .base import RedditBase
 from .redditor import Redditor
 from .subreddit import Subreddit, SubredditStream
@@ -14,6 +17,11 @@ if TYPE_CHECKING:  # pragma: no cover
     import asyncpraw
 
 
+@lru_cache(maxsize=256)
+def _subreddit_model(subreddit: str) -> str:
+    return dumps({"name": subreddit})
+
+
 class Multireddit(SubredditListingMixin, RedditBase):
     r"""A class for users' multireddits.
 
@@ -46,8 +54,12 @@ class Multireddit(SubredditListingMixin, RedditBase):
 
     STR_FIELD = "path"
     RE_INVALID = re.compile(r"[\W_]+", re.UNICODE)
+    _RE_INVALID_ASCII = re.compile(r"[\W_]+", re.ASCII)
+    # Pending author fetches keyed by event loop, created on first use
+    _author_fetches: Optional[Dict[asyncio.AbstractEventLoop, asyncio.Task]] = None
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def sluggify(title: str):
         """Return a slug version of the title.
 
@@ -56,14 +68,21 @@ class Multireddit(SubredditListingMixin, RedditBase):
         Adapted from Reddit's utils.py.
 
         """
-        title = Multireddit.RE_INVALID.sub("_", title).strip("_").lower()
+        pattern = (
+            Multireddit._RE_INVALID_ASCII if title.isascii() else Multireddit.RE_INVALID
+        )
+        title = pattern.sub("_", title).strip("_").lower()
         if len(title) > 21:  # truncate to nearest word
-            title = title[:21]
-            last_word = title.rfind("_")
-            if last_word > 0:
-                title = title[:last_word]
+            last_word = title.rfind("_", 0, 21)
+            title = title[:last_word] if last_word > 0 else title[:21]
         return title or "_"
 
+    @cachedproperty
+    def _api_path(self) -> str:
+        return API_PATH["multireddit_api"].format(
+            multi=self.name, user=self._author.name
+        )
+
     @cachedproperty
     def stream(self) -> SubredditStream:
         """Provide an instance of :class:`.SubredditStream`.
@@ -89,40 +108,103 @@ class Multireddit(SubredditListingMixin, RedditBase):
         """
         return SubredditStream(self)
 
+    @cachedproperty
+    def subreddits(self) -> List[Subreddit]:
+        r"""Provide the list of :class:`.Subreddit`\ s that make up the multireddit.
+
+        For example, to print the subreddits in multireddit ``bboe/test``:
+
+        .. code-block:: python
+
+            multireddit = await reddit.multireddit("bboe", "test", fetch=True)
+            for subreddit in multireddit.subreddits:
+                print(subreddit)
+
+        """
+        return [Subreddit(self._reddit, x["name"]) for x in self._subreddits_raw]
+
     def __init__(self, reddit: "asyncpraw.Reddit", _data: Dict[str, Any]):
         """Initialize a :class:`.Multireddit` instance."""
         self.path = None
+        self._author = None
         super().__init__(reddit, _data=_data)
-        self._author = Redditor(reddit, self.path.split("/", 3)[2])
+        self._materialize()
+
+    def _materialize(self, previous_subreddits: Optional[List[Subreddit]] = None):
+        """Wrap the raw ``path`` data and stash the raw ``subreddits`` data.
+
+        :param previous_subreddits: The already wrapped subreddits, reused when they
+            match the raw ``subreddits`` data.
+
+        """
+        # The author is the second path segment, e.g. "bboe" in "/user/bboe/m/test"
+        start = self.path.index("/", 1) + 1
+        end = self.path.find("/", start)
+        author = self.path[start:end] if end != -1 else self.path[start:]
+        if self._author != author:
+            self._author = Redditor(self._reddit, author)
+        self.__dict__.pop("_api_path", None)
         self._path = API_PATH["multireddit"].format(multi=self.name, user=self._author)
         self.path = f"/{self._path[:-1]}"  # Prevent requests for path
         if "subreddits" in self.__dict__:
-            self.subreddits = [Subreddit(reddit, x["name"]) for x in self.subreddits]
+            # Defer wrapping into Subreddit instances until first access
+            self._subreddits_raw = self.__dict__.pop("subreddits")
+            if previous_subreddits is not None and [
+                str(subreddit).lower() for subreddit in previous_subreddits
+            ] == [x["name"].lower() for x in self._subreddits_raw]:
+                self.subreddits = previous_subreddits
 
     async def _ensure_author_fetched(self):
-        if not self._author._fetched:
-            await self._author._fetch()
-
-    async def _fetch_info(self):
-        await self._ensure_author_fetched()
-        return (
-            "multireddit_api",
-            {"multi": self.name, "user": self._author.name},
-            None,
-        )
+        if self._author._fetched:
+            return
+        # Share a single in-flight fetch between concurrent callers. Tasks are bound
+        # to the loop that created them so they are tracked per loop.
+        loop = asyncio.get_running_loop()
+        if self._author_fetches is None:
+            self._author_fetches = {}
+        fetch = self._author_fetches.get(loop)
+        if fetch is None:
+            fetch = loop.create_task(self._author._fetch())
+            self._author_fetches[loop] = fetch
+            fetch.add_done_callback(partial(self._forget_author_fetch, loop))
+        await asyncio.shield(fetch)
+
+    def _forget_author_fetch(
+        self, loop: asyncio.AbstractEventLoop, fetch: asyncio.Task
+    ):
+        # Runs once the fetch is done, even when every waiter has been cancelled, so
+        # that a failed fetch is retried by the next call
+        if self._author_fetches.get(loop) is fetch:
+            del self._author_fetches[loop]
+        if not fetch.cancelled():
+            fetch.exception()  # Mark the exception as retrieved
 
     async def _fetch_data(self):
-        name, fields, params = await self._fetch_info()
-        path = API_PATH[name].format(**fields)
-        return await self._reddit.request("GET", path, params)
+        await self._ensure_author_fetched()
+        return await self._reddit.request("GET", self._api_path, None)
 
     async def _fetch(self):
         data = await self._fetch_data()
         data = data["data"]
-        other = type(self)(self._reddit, _data=data)
-        self.__dict__.update(other.__dict__)
+        previous_subreddits = self.__dict__.get("subreddits")
+        # Only copy data fields so cached private state such as _author survives
+        self.__dict__.update(
+            (key, value) for key, value in data.items() if not key.startswith("_")
+        )
+        self._materialize(previous_subreddits)
         self._fetched = True
 
+    async def _update_subreddit(
+        self,
+        method: Callable[..., Awaitable[Any]],
+        subreddit: Union[str, "asyncpraw.models.Subreddit"],
+    ):
+        subreddit = str(subreddit)
+        url = API_PATH["multireddit_update"].format(
+            multi=self.name, user=self._author, subreddit=subreddit
+        )
+        await method(url, data={"model": _subreddit_model(subreddit)})
+
     async def add(self, subreddit: "asyncpraw.models.Subreddit"):
         """Add a subreddit to this multireddit.
 
@@ -138,11 +220,41 @@ class Multireddit(SubredditListingMixin, RedditBase):
 
         """
         await self._ensure_author_fetched()
-        url = API_PATH["multireddit_update"].format(
-            multi=self.name, user=self._author, subreddit=subreddit
-        )
-        await self._reddit.put(url, data={"model": dumps({"name": str(subreddit)})})
-        self._reset_attributes("subreddits")
+        await self._update_subreddit(self._reddit.put, subreddit)
+        self._reset_attributes("subreddits", "_subreddits_raw")
+
+    async def add_many(
+        self,
+        subreddits: List[Union[str, "asyncpraw.models.Subreddit"]],
+        max_concurrency: int = 10,
+    ):
+        """Add several subreddits to this multireddit concurrently.
+
+        :param subreddits: The subreddits to add to this multi.
+        :param max_concurrency: The maximum number of requests to have in flight at
+            once (default: ``10``).
+
+        If a request fails, the remaining requests are still sent and the first
+        exception is raised once they are done.
+
+        For example, to add r/test and r/redditdev to multireddit ``bboe/test``:
+
+        .. code-block:: python
+
+            multireddit = await reddit.multireddit("bboe", "test")
+            await multireddit.add_many(["test", "redditdev"])
+
+        """
+        await self._ensure_author_fetched()
+        try:
+            await _gather_bounded(
+                partial(self._update_subreddit, self._reddit.put),
+                subreddits,
+                max_concurrency,
+            )
+        finally:
+            # Some subreddits may have been updated even if another request failed
+            self._reset_attributes("subreddits", "_subreddits_raw")
 
     async def copy(
         self, display_name: Optional[str] = None
@@ -163,16 +275,15 @@ class Multireddit(SubredditListingMixin, RedditBase):
         """
         if display_name:
             name = self.sluggify(display_name)
+            user = await self._reddit.user.me()
         else:
-            await self.load()
+            _, user = await asyncio.gather(self.load(), self._reddit.user.me())
             display_name = self.display_name
             name = self.name
         data = {
             "display_name": display_name,
             "from": self.path,
-            "to": API_PATH["multireddit"].format(
-                multi=name, user=await self._reddit.user.me()
-            ),
+            "to": API_PATH["multireddit"].format(multi=name, user=user),
         }
         return await self._reddit.post(API_PATH["multireddit_copy"], data=data)
 
@@ -188,10 +299,7 @@ class Multireddit(SubredditListingMixin, RedditBase):
 
         """
         await self._ensure_author_fetched()
-        path = API_PATH["multireddit_api"].format(
-            multi=self.name, user=self._author.name
-        )
-        await self._reddit.delete(path)
+        await self._reddit.delete(self._api_path)
 
     async def remove(self, subreddit: "asyncpraw.models.Subreddit"):
         """Remove a subreddit from this multireddit.
@@ -208,11 +316,41 @@ class Multireddit(SubredditListingMixin, RedditBase):
 
         """
         await self._ensure_author_fetched()
-        url = API_PATH["multireddit_update"].format(
-            multi=self.name, user=self._author, subreddit=subreddit
-        )
-        await self._reddit.delete(url, data={"model": dumps({"name": str(subreddit)})})
-        self._reset_attributes("subreddits")
+        await self._update_subreddit(self._reddit.delete, subreddit)
+        self._reset_attributes("subreddits", "_subreddits_raw")
+
+    async def remove_many(
+        self,
+        subreddits: List[Union[str, "asyncpraw.models.Subreddit"]],
+        max_concurrency: int = 10,
+    ):
+        """Remove several subreddits from this multireddit concurrently.
+
+        :param subreddits: The subreddits to remove from this multi.
+        :param max_concurrency: The maximum number of requests to have in flight at
+            once (default: ``10``).
+
+        If a request fails, the remaining requests are still sent and the first
+        exception is raised once they are done.
+
+        For example, to remove r/test and r/redditdev from multireddit ``bboe/test``:
+
+        .. code-block:: python
+
+            multireddit = await reddit.multireddit("bboe", "test")
+            await multireddit.remove_many(["test", "redditdev"])
+
+        """
+        await self._ensure_author_fetched()
+        try:
+            await _gather_bounded(
+                partial(self._update_subreddit, self._reddit.delete),
+                subreddits,
+                max_concurrency,
+            )
+        finally:
+            # Some subreddits may have been updated even if another request failed
+            self._reset_attributes("subreddits", "_subreddits_raw")
 
     async def update(
         self,
@@ -249,12 +387,15 @@ class Multireddit(SubredditListingMixin, RedditBase):
 
         """
         if "subreddits" in updated_settings:
+            # Entries that already have the ``{"name": ...}`` shape are sent as is
             updated_settings["subreddits"] = [
-                {"name": str(sub)} for sub in updated_settings["subreddits"]
+                sub if isinstance(sub, dict) else {"name": str(sub)}
+                for sub in updated_settings["subreddits"]
             ]
         await self._ensure_author_fetched()
-        path = API_PATH["multireddit_api"].format(
-            multi=self.name, user=self._author.name
+        new = await self._reddit.put(
+            self._api_path, data={"model": dumps(updated_settings)}
         )
-        new = await self._reddit.put(path, data={"model": dumps(updated_settings)})
+        self.__dict__.pop("_api_path", None)
+        self.__dict__.pop("subreddits", None)
         self.__dict__.update(new.__dict__)
@@ -1,9 +1,23 @@
 """Provide the Redditor class."""
-from json import dumps
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional, Union
+import asyncio
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from weakref import WeakKeyDictionary
 
 from ...const import API_PATH
 from ...util.cache import cachedproperty
+from ...util.serializer import dumps
 from ..listing.mixins import RedditorListingMixin
 from ..util import stream_generator
 from .base import RedditBase
@@ -13,6 +27,74 @@ if TYPE_CHECKING:  # pragma: no cover
     import asyncpraw
 
 
+class _UsernameBatch:
+    """Resolve the fullnames requested within one event loop iteration together.
+
+    Every :meth:`.Redditor._fetch_username` call made before the batch is flushed
+    shares a single request to the ``user_by_fullname`` endpoint, which accepts up to
+    100 comma-separated IDs.
+
+    """
+
+    MAX_IDS = 100
+
+    def __init__(self, reddit: "asyncpraw.Reddit", loop: asyncio.AbstractEventLoop):
+        """Initialize a :class:`._UsernameBatch` instance."""
+        self._futures: Dict[str, asyncio.Future] = {}
+        self._reddit = reddit
+        self.flushed = False
+        self.loop = loop
+        loop.call_soon(self._flush)
+
+    def _flush(self):
+        self.flushed = True
+        if _username_batches.get(self._reddit) is self:
+            del _username_batches[self._reddit]
+        self.loop.create_task(self._resolve())
+
+    async def _resolve(self):
+        fullnames = list(self._futures)
+        for start in range(0, len(fullnames), self.MAX_IDS):
+            chunk = fullnames[start : start + self.MAX_IDS]
+            try:
+                response = await self._reddit.get(
+                    API_PATH["user_by_fullname"], params={"ids": ",".join(chunk)}
+                )
+            except Exception as exception:
+                for fullname in chunk:
+                    self._set(fullname, exception=exception)
+                continue
+            for fullname in chunk:
+                try:
+                    self._set(fullname, result=response[fullname]["name"])
+                except (KeyError, TypeError) as exception:
+                    self._set(fullname, exception=exception)
+
+    def _set(
+        self,
+        fullname: str,
+        *,
+        exception: Optional[BaseException] = None,
+        result: Optional[str] = None,
+    ):
+        future = self._futures[fullname]
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+    async def username(self, fullname: str) -> str:
+        """Return the name of the redditor with ``fullname`` once resolved."""
+        if fullname not in self._futures:
+            self._futures[fullname] = self.loop.create_future()
+        return await asyncio.shield(self._futures[fullname])
+
+
+_username_batches: "WeakKeyDictionary[asyncpraw.Reddit, _UsernameBatch]" = (
+    WeakKeyDictionary()
+)
+
+
 class Redditor(MessageableMixin, RedditorListingMixin, FullnameMixin, RedditBase):
     """A class representing the users of Reddit.
 
@@ -104,12 +186,12 @@ class Redditor(MessageableMixin, RedditorListingMixin, FullnameMixin, RedditBase
         """
         return RedditorStream(self)
 
-    @property
+    @cachedproperty
     def _kind(self) -> str:
         """Return the class's kind."""
         return self._reddit.config.kinds["redditor"]
 
-    @property
+    @cachedproperty
     def _path(self) -> str:
         return API_PATH["user"].format(user=self)
 
@@ -129,7 +211,7 @@ class Redditor(MessageableMixin, RedditorListingMixin, FullnameMixin, RedditBase
         Exactly one of ``name``, ``fullname`` or ``_data`` must be provided.
 
         """
-        if (name, fullname, _data).count(None) != 2:
+        if (name is None) + (fullname is None) + (_data is None) != 2:
             raise TypeError(
                 "Exactly one of `name`, `fullname`, or `_data` must be provided."
             )
@@ -145,18 +227,22 @@ class Redditor(MessageableMixin, RedditorListingMixin, FullnameMixin, RedditBase
         super().__init__(reddit, _data=_data, _extra_attribute_to_check="_fullname")
 
     def __setattr__(self, name: str, value: Any):
-        """Objectify the subreddit attribute."""
-        if name == "subreddit" and value:
+        """Objectify the subreddit attribute and reset the cached path on rename."""
+        if name == "name":
+            self.__dict__.pop("_path", None)
+            self.__dict__.pop("_user_paths", None)
+        elif name == "subreddit" and value:
             from .user_subreddit import UserSubreddit
 
             value = UserSubreddit(reddit=self._reddit, _data=value)
         super().__setattr__(name, value)
 
     async def _fetch_username(self, fullname):
-        response = await self._reddit.get(
-            API_PATH["user_by_fullname"], params={"ids": fullname}
-        )
-        return response[fullname]["name"]
+        loop = asyncio.get_running_loop()
+        batch = _username_batches.get(self._reddit)
+        if batch is None or batch.flushed or batch.loop is not loop:
+            batch = _username_batches[self._reddit] = _UsernameBatch(self._reddit, loop)
+        return await batch.username(fullname)
 
     async def _fetch_info(self):
         if hasattr(self, "_fullname"):
@@ -171,12 +257,25 @@ class Redditor(MessageableMixin, RedditorListingMixin, FullnameMixin, RedditBase
     async def _fetch(self):
         data = await self._fetch_data()
         data = data["data"]
-        other = type(self)(self._reddit, _data=data)
-        self.__dict__.update(other.__dict__)
+        for attribute, value in data.items():
+            setattr(self, attribute, value)
         self._fetched = True
 
+    def _user_path(self, endpoint: str) -> str:
+        """Return ``API_PATH[endpoint]`` formatted for this redditor.
+
+        The formatted paths are cached per instance until ``name`` changes.
+
+        """
+        paths = self.__dict__.get("_user_paths")
+        if paths is None:
+            paths = self.__dict__["_user_paths"] = {}
+        if endpoint not in paths:
+            paths[endpoint] = API_PATH[endpoint].format(user=self)
+        return paths[endpoint]
+
     async def _friend(self, method, data):
-        url = API_PATH["friend_v1"].format(user=self)
+        url = self._user_path("friend_v1")
         await self._reddit.request(method, url, data=dumps(data))
 
     async def block(self):
@@ -259,7 +358,7 @@ class Redditor(MessageableMixin, RedditorListingMixin, FullnameMixin, RedditBase
             friend_data = info.date
 
         """
-        return await self._reddit.get(API_PATH["friend_v1"].format(user=self))
+        return await self._reddit.get(self._user_path("friend_v1"))
 
     async def gild(self, months: int = 1):
         """Gild the :class:`.Redditor`.
@@ -329,7 +428,7 @@ class Redditor(MessageableMixin, RedditorListingMixin, FullnameMixin, RedditBase
             :meth:`.User.moderator_subreddits`
 
         """
-        return await self._reddit.get(API_PATH["moderated"].format(user=self)) or []
+        return await self._reddit.get(self._user_path("moderated")) or []
 
     async def multireddits(self) -> List["asyncpraw.models.Multireddit"]:
         """Return a list of the redditor's public multireddits.
@@ -342,7 +441,40 @@ class Redditor(MessageableMixin, RedditorListingMixin, FullnameMixin, RedditBase
             multireddits = await redditor.multireddits()
 
         """
-        return await self._reddit.get(API_PATH["multireddit_user"].format(user=self))
+        return await self._reddit.get(self._user_path("multireddit_user"))
+
+    async def profile_bundle(
+        self,
+    ) -> Tuple[
+        List["asyncpraw.models.Subreddit"],
+        List["asyncpraw.models.Multireddit"],
+        List["asyncpraw.models.Trophy"],
+    ]:
+        """Return the redditor's moderated subreddits, multireddits, and trophies.
+
+        :returns: A tuple of the results of :meth:`.moderated`, :meth:`.multireddits`,
+            and :meth:`.trophies`.
+
+        The three requests are issued concurrently, so this takes roughly as long as
+        the slowest of them rather than their sum.
+
+        .. note::
+
+            The requests still count towards the rate limit individually. When the
+            rate limit is exhausted they will be delayed like any other request.
+
+        Usage:
+
+        .. code-block:: python
+
+            redditor = await reddit.redditor("spez")
+            moderated, multireddits, trophies = await redditor.profile_bundle()
+
+        """
+        moderated, multireddits, trophies = await asyncio.gather(
+            self.moderated(), self.multireddits(), self.trophies()
+        )
+        return moderated, multireddits, trophies
 
     async def trophies(self) -> List["asyncpraw.models.Trophy"]:
         """Return a list of the redditor's trophies.
@@ -362,7 +494,7 @@ class Redditor(MessageableMixin, RedditorListingMixin, FullnameMixin, RedditBase
                 print(trophy.description)
 
         """
-        return list(await self._reddit.get(API_PATH["trophies"].format(user=self)))
+        return list(await self._reddit.get(self._user_path("trophies")))
 
     async def trust(self):
         """Add the :class:`.Redditor` to your whitelist of trusted users.
@@ -438,6 +570,53 @@ class Redditor(MessageableMixin, RedditorListingMixin, FullnameMixin, RedditBase
         await self._friend(method="DELETE", data={"id": str(self)})
 
 
+class _SharedListing:
+    """Share a listing response between identical calls made within ``ttl`` seconds.
+
+    Streams poll the same listing with the same arguments, so several streams over one
+    redditor can reuse a single response instead of each issuing a request.
+
+    """
+
+    def __init__(self, function: Callable[..., AsyncIterator[Any]], ttl: float = 1.0):
+        """Initialize a :class:`._SharedListing` instance."""
+        self._function = function
+        self._responses: Dict[str, Tuple[float, asyncio.Future]] = {}
+        self._ttl = ttl
+
+    def __call__(self, **kwargs: Any) -> AsyncIterator[Any]:
+        """Return an async iterator over the, possibly shared, listing response."""
+        return self._iterate(kwargs)
+
+    async def _fetch(self, kwargs: Dict[str, Any]) -> List[Any]:
+        return [item async for item in self._function(**kwargs)]
+
+    async def _iterate(self, kwargs: Dict[str, Any]) -> AsyncIterator[Any]:
+        key = repr(sorted(kwargs.items()))
+        now = time.monotonic()
+        for stale_key in [
+            cached_key
+            for cached_key, (expires_at, _) in self._responses.items()
+            if expires_at <= now
+        ]:
+            del self._responses[stale_key]
+        if key not in self._responses:
+            self._responses[key] = (
+                now + self._ttl,
+                asyncio.ensure_future(self._fetch(kwargs)),
+            )
+        _, future = self._responses[key]
+        try:
+            items = await asyncio.shield(future)
+        except Exception:
+            # Don't share failures so that the next poll retries the request
+            if key in self._responses and self._responses[key][1] is future:
+                del self._responses[key]
+            raise
+        for item in items:
+            yield item
+
+
 class RedditorStream:
     """Provides submission and comment streams."""
 
@@ -448,6 +627,8 @@ class RedditorStream:
 
         """
         self.redditor = redditor
+        self._comments_new = None
+        self._submissions_new = None
 
     def comments(
         self, **stream_options: Union[str, int, Dict[str, str]]
@@ -468,7 +649,9 @@ class RedditorStream:
                 print(comment)
 
         """
-        return stream_generator(self.redditor.comments.new, **stream_options)
+        if self._comments_new is None:
+            self._comments_new = _SharedListing(self.redditor.comments.new)
+        return stream_generator(self._comments_new, **stream_options)
 
     def submissions(
         self, **stream_options: Union[str, int, Dict[str, str]]
@@ -489,4 +672,6 @@ class RedditorStream:
                 print(submission)
 
         """
-        return stream_generator(self.redditor.submissions.new, **stream_options)
+        if self._submissions_new is None:
+            self._submissions_new = _SharedListing(self.redditor.submissions.new)
+        return stream_generator(self._submissions_new, **stream_options)
@@ -1,5 +1,7 @@
 """Provide the Rule class."""
-from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Union
+import asyncio
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional, Union
 from urllib.parse import quote
 from warnings import warn
 
@@ -11,6 +13,8 @@ from .base import RedditBase
 if TYPE_CHECKING:  # pragma: no cover
     import asyncpraw
 
+_UPDATE_FIELDS = ("description", "kind", "short_name", "violation_reason")
+
 
 class Rule(RedditBase):
     """An individual :class:`.Rule` object.
@@ -61,6 +65,19 @@ class Rule(RedditBase):
         """
         return RuleModeration(self)
 
+    @property
+    def subreddit(self) -> "asyncpraw.models.Subreddit":
+        """Return the :class:`.Subreddit` the rule belongs to."""
+        if self._subreddit is None:
+            raise ValueError(
+                "The Rule is missing a subreddit. File a bug report at Async PRAW."
+            )
+        return self._subreddit
+
+    @subreddit.setter
+    def subreddit(self, value: Optional["asyncpraw.models.Subreddit"]):
+        self._subreddit = value
+
     def __init__(
         self,
         reddit: "asyncpraw.Reddit",
@@ -69,34 +86,24 @@ class Rule(RedditBase):
         _data: Optional[Dict[str, str]] = None,
     ):
         """Initialize a :class:`.Rule` instance."""
-        if (short_name, _data).count(None) != 1:
+        if (short_name is None) == (_data is None):
             raise ValueError("Either short_name or _data needs to be given.")
         if short_name:
             self.short_name = short_name
         # Note: The subreddit parameter can be None, because the objector does not know
         # this info. In that case, it is the responsibility of the caller to set the
         # `subreddit` property on the returned value
-        self.subreddit = subreddit
+        self._subreddit = subreddit
         super().__init__(reddit, _data=_data)
 
-    def __getattribute__(self, attribute: str) -> Any:
-        """Get the value of an attribute."""
-        value = super().__getattribute__(attribute)
-        if attribute == "subreddit" and value is None:
-            raise ValueError(
-                "The Rule is missing a subreddit. File a bug report at Async PRAW."
-            )
-        return value
-
     async def _fetch(self):
-        async for rule in self.subreddit.rules:
-            if rule.short_name == self.short_name:
-                self.__dict__.update(rule.__dict__)
-                self._fetched = True
-                return
-        raise ClientException(
-            f"Subreddit {self.subreddit} does not have the rule {self.short_name}"
-        )
+        rule = await self.subreddit.rules._get_by_name(self.short_name, force=True)
+        if rule is None:
+            raise ClientException(
+                f"Subreddit {self.subreddit} does not have the rule {self.short_name}"
+            )
+        self.__dict__.update(rule.__dict__)
+        self._fetched = True
 
 
 class SubredditRules:
@@ -120,8 +127,15 @@ class SubredditRules:
             short_name="No spam", kind="all", description="Do not spam. Spam bad"
         )
 
+    The list of rules is cached for :attr:`.CACHE_TTL` seconds, so that iterating the
+    rules or fetching several rules by name only requests the rules once. Moderation
+    actions made through :attr:`.mod` clear the cache.
+
     """
 
+    #: The number of seconds for which the list of rules is reused.
+    CACHE_TTL = 60
+
     @cachedproperty
     def mod(self) -> "SubredditRulesModeration":
         """Contain methods to moderate subreddit rules as a whole.
@@ -174,9 +188,7 @@ class SubredditRules:
             category=DeprecationWarning,
             stacklevel=2,
         )
-        return await self._reddit.request(
-            "GET", API_PATH["rules"].format(subreddit=self.subreddit)
-        )
+        return list(await self._rule_list())
 
     async def get_rule(
         self, short_name: Union[str, int, slice]
@@ -218,8 +230,11 @@ class SubredditRules:
         if not isinstance(short_name, str):
             rules = await self._rule_list()
             return rules[short_name]
-        rule = Rule(self._reddit, subreddit=self.subreddit, short_name=short_name)
-        await rule._fetch()
+        rule = await self._get_by_name(short_name)
+        if rule is None:
+            raise ClientException(
+                f"Subreddit {self.subreddit} does not have the rule {short_name}"
+            )
         return rule
 
     def __init__(self, subreddit: "asyncpraw.models.Subreddit"):
@@ -230,6 +245,11 @@ class SubredditRules:
         """
         self.subreddit = subreddit
         self._reddit = subreddit._reddit
+        self._rules_path = API_PATH["rules"].format(subreddit=subreddit)
+        self._cache_ts = 0.0
+        self._cached_rules = None
+        self._inflight = None
+        self._rules_by_name = {}
 
     async def __aiter__(self) -> AsyncIterator["asyncpraw.models.Rule"]:
         """Iterate through the rules of the subreddit.
@@ -247,22 +267,67 @@ class SubredditRules:
                 print(rule)
 
         """
-        rules = await self._rule_list()
-        for rule in rules:
+        for rule in await self._rule_list():
             yield rule
 
-    async def _rule_list(self) -> List[Rule]:
+    async def _get_by_name(
+        self, short_name: str, force: bool = False
+    ) -> Optional[Rule]:
+        """Get the :class:`.Rule` named ``short_name``, or ``None`` if there is none.
+
+        :param force: Request the rules even if a cached list is available (default:
+            ``False``).
+
+        """
+        rule_list = await self._rule_list(force=force)
+        if not self._rules_by_name:
+            # The cache was cleared while the rules were being requested
+            return next(
+                (rule for rule in rule_list if rule.short_name == short_name), None
+            )
+        return self._rules_by_name.get(short_name)
+
+    async def _rule_list(self, force: bool = False) -> List[Rule]:
         """Get a list of :class:`.Rule` objects.
 
+        Concurrent callers share a single request for the rules. The returned list is
+        shared with the cache and must not be modified.
+
+        :param force: Request the rules even if a cached list is available (default:
+            ``False``).
+
         :returns: A list of instances of :class:`.Rule`.
 
         """
-        rule_list = await self._reddit.get(
-            API_PATH["rules"].format(subreddit=self.subreddit)
-        )
-        for rule in rule_list:
-            rule.subreddit = self.subreddit
-        return rule_list
+        if (
+            not force
+            and self._cached_rules is not None
+            and time.monotonic() - self._cache_ts < self.CACHE_TTL
+        ):
+            return self._cached_rules
+        if force or self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._fetch_rules())
+        return await asyncio.shield(self._inflight)
+
+    def _clear_cache(self):
+        self._cached_rules = None
+        self._inflight = None
+        self._rules_by_name = {}
+
+    async def _fetch_rules(self) -> List[Rule]:
+        task = asyncio.current_task()
+        try:
+            rule_list = await self._reddit.get(self._rules_path)
+            for rule in rule_list:
+                rule._subreddit = self.subreddit
+            if self._inflight is task:
+                self._cached_rules = rule_list
+                self._rules_by_name = {rule.short_name: rule for rule in rule_list}
+                self._cache_ts = time.monotonic()
+            return rule_list
+        finally:
+            if self._inflight is task:
+                self._inflight = None
 
 
 class RuleModeration:
@@ -286,6 +351,10 @@ class RuleModeration:
 
     """
 
+    @cachedproperty
+    def _subreddit_name(self) -> str:
+        return str(self.rule.subreddit)
+
     def __init__(self, rule: "asyncpraw.models.Rule"):
         """Initialize a :class:`.RuleModeration` instance."""
         self.rule = rule
@@ -303,10 +372,11 @@ class RuleModeration:
 
         """
         data = {
-            "r": str(self.rule.subreddit),
+            "r": self._subreddit_name,
             "short_name": self.rule.short_name,
         }
         await self.rule._reddit.post(API_PATH["remove_subreddit_rule"], data=data)
+        self.rule.subreddit.rules._clear_cache()
 
     async def update(
         self,
@@ -339,21 +409,19 @@ class RuleModeration:
 
         """
         data = {
-            "r": str(self.rule.subreddit),
+            "r": self._subreddit_name,
             "old_short_name": self.rule.short_name,
         }
-        for name, value in {
-            "description": description,
-            "kind": kind,
-            "short_name": short_name,
-            "violation_reason": violation_reason,
-        }.items():
+        for name, value in zip(
+            _UPDATE_FIELDS, (description, kind, short_name, violation_reason)
+        ):
             data[name] = getattr(self.rule, name) if value is None else value
         response = await self.rule._reddit.post(
             API_PATH["update_subreddit_rule"], data=data
         )
+        self.rule.subreddit.rules._clear_cache()
         updated_rule = response[0]
-        updated_rule.subreddit = self.rule.subreddit
+        updated_rule._subreddit = self.rule.subreddit
         return updated_rule
 
 
@@ -382,6 +450,10 @@ class SubredditRulesModeration:
 
     """
 
+    @cachedproperty
+    def _subreddit_name(self) -> str:
+        return str(self.subreddit_rules.subreddit)
+
     def __init__(self, subreddit_rules: SubredditRules):
         """Initialize a :class:`.SubredditRulesModeration` instance."""
         self.subreddit_rules = subreddit_rules
@@ -416,7 +488,7 @@ class SubredditRulesModeration:
 
         """
         data = {
-            "r": str(self.subreddit_rules.subreddit),
+            "r": self._subreddit_name,
             "description": description,
             "kind": kind,
             "short_name": short_name,
@@ -427,8 +499,9 @@ class SubredditRulesModeration:
         response = await self.subreddit_rules._reddit.post(
             API_PATH["add_subreddit_rule"], data=data
         )
+        self.subreddit_rules._clear_cache()
         new_rule = response[0]
-        new_rule.subreddit = self.subreddit_rules.subreddit
+        new_rule._subreddit = self.subreddit_rules.subreddit
         return new_rule
 
     async def reorder(
@@ -457,12 +530,13 @@ class SubredditRulesModeration:
             ",".join([rule.short_name for rule in rule_list]), safe=","
         )
         data = {
-            "r": str(self.subreddit_rules.subreddit),
+            "r": self._subreddit_name,
             "new_rule_order": order_string,
         }
         response = await self.subreddit_rules._reddit.post(
             API_PATH["reorder_subreddit_rules"], data=data
         )
+        self.subreddit_rules._clear_cache()
         for rule in response:
-            rule.subreddit = self.subreddit_rules.subreddit
+            rule._subreddit = self.subreddit_rules.subreddit
         return response
@@ -494,6 +494,10 @@ class Submission(SubmissionListingMixin, UserContentMixin, FullnameMixin, Reddit
         """Return the class's kind."""
         return self._reddit.config.kinds["submission"]
 
+    @cachedproperty
+    def _path(self) -> str:
+        return API_PATH["submission"].format(id=self.id)
+
     @cachedproperty
     def flair(self) -> SubmissionFlair:
         """Provide an instance of :class:`.SubmissionFlair`.
@@ -3,7 +3,16 @@ import asyncio
 import random
 from collections import OrderedDict
 from functools import wraps
-from typing import Any, AsyncGenerator, Callable, List, Optional, Set
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+)
 from warnings import warn
 
 
@@ -64,6 +73,41 @@ class ExponentialCounter:
         self._base = 1
 
 
+async def _gather_bounded(
+    function: Callable[[Any], Awaitable[Any]],
+    items: Iterable[Any],
+    max_concurrency: int,
+) -> List[Any]:
+    """Await ``function(item)`` for every item with at most ``max_concurrency`` running.
+
+    Every call runs to completion even if another one fails. The first exception, in
+    the order of ``items``, is raised once all calls are done.
+
+    :returns: The results in the same order as ``items``.
+
+    :raises: :py:class:`ValueError` if ``max_concurrency`` is less than ``1``.
+
+    """
+    if max_concurrency < 1:
+        raise ValueError(
+            "An incorrect value was given for max_concurrency. The value must be at"
+            f" least 1, but the given value is {max_concurrency}."
+        )
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(item: Any) -> Any:
+        async with semaphore:
+            return await function(item)
+
+    results = await asyncio.gather(
+        *(run(item) for item in items), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
 def deprecate_lazy(func):  # noqa: D401
     """A decorator used for deprecating the ``lazy`` keyword argument."""
 
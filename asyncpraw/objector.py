@@ -1,11 +1,10 @@
 """Provides the Objector class."""
 from datetime import datetime
-from json import loads
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from .exceptions import ClientException, RedditAPIException
 from .models.reddit.base import RedditBase
-from .util import snake_case_keys
+from .util import loads, snake_case_keys
 
 if TYPE_CHECKING:  # pragma: no cover
     import asyncpraw
@@ -153,7 +152,9 @@ class Objector:
             parser = self.parsers[self._reddit.config.kinds["subreddit"]]
         elif {"mod_action_data", "user_note_data"}.issubset(data):
             parser = self.parsers["ModNote"]
-        elif "created" in data and {"mod_action_data", "user_note_data"}.issubset(data["created"]):
+        elif "created" in data and {"mod_action_data", "user_note_data"}.issubset(
+            data["created"]
+        ):
             # kinda awkward. The mod notes create endpoint returns a json like {"created": {...note...
             data = data["created"]
             parser = self.parsers["ModNote"]
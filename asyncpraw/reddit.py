@@ -272,6 +272,7 @@ class Reddit:
         """
         self._core = self._authorized_core = self._read_only_core = None
         self._objector = None
+        self._request_semaphore = None
         self._token_manager = token_manager
         self._unique_counter = 0
         self._validate_on_submit = False
@@ -967,16 +968,21 @@ class Reddit:
         """
         if data and json:
             raise ClientException("At most one of `data` or `json` is supported.")
-        try:
-            return await self._core.request(
-                method,
-                path,
-                data=data,
-                files=files,
-                params=params,
-                timeout=self.config.timeout,
-                json=json,
+        if self._request_semaphore is None:
+            self._request_semaphore = asyncio.Semaphore(
+                self.config.max_concurrent_requests
             )
+        try:
+            async with self._request_semaphore:
+                return await self._core.request(
+                    method,
+                    path,
+                    data=data,
+                    files=files,
+                    params=params,
+                    timeout=self.config.timeout,
+                    json=json,
+                )
         except BadRequest as exception:
             try:
                 data = await exception.response.json(content_type=None)
@@ -1,4 +1,5 @@
 """Package imports for utilities."""
 
 from .cache import cachedproperty  # noqa: F401
+from .serializer import dumps, loads  # noqa: F401
 from .snake import camel_to_snake, snake_case_keys  # noqa: F401
@@ -10,7 +10,9 @@ class cachedproperty:
     same name as the property. When the name is later accessed, the value in the
     instance dictionary takes precedence over the (non-data descriptor) property.
 
-    This is useful for implementing lazy-loaded properties.
+    This is useful for implementing lazy-loaded properties. Unlike
+    :func:`functools.cached_property` no lock is taken, so after the first access
+    reads cost a single instance dictionary lookup.
 
     The cache can be invalidated via `delattr()`, or by modifying `__dict__` directly.
     It will be repopulated on next access.
@@ -22,6 +24,7 @@ class cachedproperty:
     def __init__(self, func: Callable[[Any], Any], doc: Optional[str] = None):
         """Initialize a :class:`.cachedproperty` instance."""
         self.func = self.__wrapped__ = func
+        self._attribute = func.__name__
 
         if doc is None:
             doc = func.__doc__
@@ -41,7 +44,7 @@ class cachedproperty:
         if obj is None:
             return self
 
-        value = obj.__dict__[self.func.__name__] = self.func(obj)
+        value = obj.__dict__[self._attribute] = self.func(obj)
         return value
 
     def __repr__(self) -> str:
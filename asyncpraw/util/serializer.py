@@ -0,0 +1,22 @@
+"""Provide a JSON serializer and deserializer."""
+
+from functools import partial
+from typing import Any, Union
+
+try:
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as _orjson_loads
+
+    def dumps(obj: Any) -> str:
+        """Return ``obj`` serialized as compact JSON using :mod:`orjson`."""
+        return _orjson_dumps(obj).decode()
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Return the object deserialized from the JSON ``data`` using :mod:`orjson`."""
+        return _orjson_loads(data)
+
+except ImportError:
+    from json import dumps as _json_dumps
+    from json import loads  # noqa: F401
+
+    dumps = partial(_json_dumps, separators=(",", ":"))
@@ -22,10 +22,12 @@ extras = {
         "sphinx_rtd_theme",
         "sphinxcontrib-trio",
     ],
+    "orjson": ["orjson"],
     "readthedocs": ["sphinx", "sphinx_rtd_theme", "sphinxcontrib-trio"],
     "test": [
         "asynctest >=0.13.0",
         "mock >=0.8",
+        "orjson",
         "pytest >=2.7.3",
         "pytest-asyncio",
         "pytest-vcr",
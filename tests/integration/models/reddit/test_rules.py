@@ -54,7 +54,8 @@ class TestRule(IntegrationTest):
         subreddit = await self.reddit.subreddit(pytest.placeholders.test_subreddit)
         with self.use_cassette():
             rules = await subreddit.rules()
-            assert rules["rules"][0]["short_name"] == "Test post 12"
+            assert isinstance(rules[0], Rule)
+            assert rules[0].short_name == "Test post 12"
 
     async def test_iter_rule_string(self):
         subreddit = await self.reddit.subreddit(pytest.placeholders.test_subreddit)
@@ -1,7 +1,8 @@
 import pytest
+from asynctest import mock
 
 from asyncpraw.exceptions import ClientException
-from asyncpraw.models import Comment
+from asyncpraw.models import Comment, Submission
 
 from ... import UnitTest
 
@@ -107,3 +108,24 @@ class TestComment(UnitTest):
         assert comment._fetched
         with pytest.raises(AttributeError):
             comment._ipython_canary_method_should_not_exist_
+
+    @mock.patch("asyncpraw.Reddit.post", new_callable=mock.CoroutineMock)
+    async def test_clear_vote_many(self, mock_post):
+        targets = [Comment(self.reddit, "dummy"), Submission(self.reddit, "dummy")]
+        await Comment.clear_vote_many(targets)
+        assert mock_post.call_count == 2
+        mock_post.assert_any_call("api/vote/", data={"dir": "0", "id": "t1_dummy"})
+        mock_post.assert_any_call("api/vote/", data={"dir": "0", "id": "t3_dummy"})
+
+    @mock.patch("asyncpraw.Reddit.post", new_callable=mock.CoroutineMock)
+    async def test_reply_many(self, mock_post):
+        reply = Comment(self.reddit, "reply")
+        mock_post.side_effect = [[reply], []]
+        targets = [Comment(self.reddit, "dummy"), Submission(self.reddit, "dummy")]
+        assert await Comment.reply_many(targets, "body") == [reply, None]
+        mock_post.assert_any_call(
+            "api/comment/", data={"text": "body", "thing_id": "t1_dummy"}
+        )
+        mock_post.assert_any_call(
+            "api/comment/", data={"text": "body", "thing_id": "t3_dummy"}
+        )
@@ -1,4 +1,6 @@
-from asyncpraw.models import MoreComments
+from asynctest import mock
+
+from asyncpraw.models import MoreComments, Submission
 
 from ... import UnitTest
 
@@ -20,3 +22,17 @@ class TestComment(UnitTest):
         )
         assert more == more2
         assert more != 5
+
+    @mock.patch("asyncpraw.Reddit.post", new_callable=mock.CoroutineMock)
+    async def test_comments__prefetched(self, mock_post):
+        mock_post.return_value = []
+        more = MoreComments(self.reddit, {"children": ["a", "b"], "count": 2})
+        more.submission = Submission(self.reddit, id="abc")
+        more._prefetch(update=False)
+        more._prefetch(update=False)
+        assert await more.comments(update=False) == []
+        assert await more.comments(update=False) == []
+        mock_post.assert_called_once_with(
+            "api/morechildren/",
+            data={"children": "a,b", "link_id": "t3_abc", "sort": "confidence"},
+        )
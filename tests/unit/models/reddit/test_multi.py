@@ -0,0 +1,211 @@
+import asyncio
+
+import pytest
+from asynctest import mock
+
+from asyncpraw.models import Multireddit, Subreddit
+
+from ... import UnitTest
+
+
+class TestMultireddit(UnitTest):
+    def _multireddit(self):
+        return Multireddit(
+            self.reddit, _data={"name": "test", "path": "/user/bboe/m/test"}
+        )
+
+    def test_subreddits__lazy(self):
+        multireddit = Multireddit(
+            self.reddit,
+            _data={
+                "name": "test",
+                "path": "/user/bboe/m/test",
+                "subreddits": [{"name": "redditdev"}],
+            },
+        )
+        assert "subreddits" not in multireddit.__dict__
+        assert multireddit.subreddits == ["redditdev"]
+        assert multireddit.subreddits is multireddit.subreddits
+
+    async def test_fetch__updates_in_place(self):
+        multireddit = Multireddit(
+            self.reddit,
+            _data={
+                "name": "test",
+                "path": "/user/bboe/m/test",
+                "subreddits": [{"name": "redditdev"}],
+            },
+        )
+        author = multireddit._author
+        subreddits = multireddit.subreddits
+        data = {
+            "data": {
+                "display_name": "Test",
+                "name": "test",
+                "path": "/user/bboe/m/test",
+                "subreddits": [{"name": "RedditDev"}],
+            }
+        }
+        with mock.patch.object(
+            multireddit, "_fetch_data", mock.CoroutineMock(return_value=data)
+        ):
+            await multireddit._fetch()
+        assert multireddit._fetched
+        assert multireddit.display_name == "Test"
+        assert multireddit._author is author
+        assert multireddit.subreddits is subreddits
+
+        data["data"]["subreddits"].append({"name": "test"})
+        with mock.patch.object(
+            multireddit, "_fetch_data", mock.CoroutineMock(return_value=data)
+        ):
+            await multireddit._fetch()
+        assert multireddit.subreddits == ["RedditDev", "test"]
+
+        data["data"]["_author"] = "spez"
+        with mock.patch.object(
+            multireddit, "_fetch_data", mock.CoroutineMock(return_value=data)
+        ):
+            await multireddit._fetch()
+        assert multireddit._author is author
+
+    async def test_ensure_author_fetched__coalesces_concurrent_calls(self):
+        multireddit = self._multireddit()
+        calls = []
+        release = asyncio.Event()
+
+        async def fetch():
+            calls.append(None)
+            await release.wait()
+            multireddit._author._fetched = True
+
+        asyncio.get_event_loop().call_soon(release.set)
+
+        with mock.patch.object(multireddit._author, "_fetch", fetch):
+            await asyncio.gather(
+                *(multireddit._ensure_author_fetched() for _ in range(5))
+            )
+        assert len(calls) == 1
+        assert not multireddit._author_fetches
+
+    async def test_ensure_author_fetched__retries_after_cancelled_failure(self):
+        multireddit = self._multireddit()
+        started = asyncio.Event()
+        release = asyncio.Event()
+        calls = []
+
+        async def fetch():
+            calls.append(None)
+            if len(calls) == 1:
+                started.set()
+                await release.wait()
+                raise RuntimeError
+            multireddit._author._fetched = True
+
+        with mock.patch.object(multireddit._author, "_fetch", fetch):
+            waiter = asyncio.ensure_future(multireddit._ensure_author_fetched())
+            await started.wait()
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            pending = multireddit._author_fetches[asyncio.get_running_loop()]
+            release.set()
+            with pytest.raises(RuntimeError):
+                await pending
+            assert not multireddit._author_fetches
+            await multireddit._ensure_author_fetched()
+        assert len(calls) == 2
+
+    def test_author_fetches__lazy(self):
+        assert "_author_fetches" not in self._multireddit().__dict__
+
+    async def test_ensure_author_fetched__retries_after_failure(self):
+        multireddit = self._multireddit()
+        fetch = mock.CoroutineMock(side_effect=[RuntimeError, None])
+        with mock.patch.object(multireddit._author, "_fetch", fetch):
+            try:
+                await multireddit._ensure_author_fetched()
+            except RuntimeError:
+                pass
+            await multireddit._ensure_author_fetched()
+        assert fetch.call_count == 2
+
+    @mock.patch("asyncpraw.Reddit.put", new_callable=mock.CoroutineMock)
+    async def test_add_many(self, mock_put):
+        multireddit = self._multireddit()
+        multireddit._author._fetched = True
+        await multireddit.add_many(["redditdev", "test"])
+        assert mock_put.call_count == 2
+        mock_put.assert_any_call(
+            "api/multi/user/bboe/m/test/r/redditdev",
+            data={"model": '{"name":"redditdev"}'},
+        )
+        assert not multireddit._fetched
+
+    @mock.patch("asyncpraw.Reddit.put", new_callable=mock.CoroutineMock)
+    async def test_add_many__failure(self, mock_put):
+        mock_put.side_effect = [None, RuntimeError]
+        multireddit = Multireddit(
+            self.reddit,
+            _data={
+                "name": "test",
+                "path": "/user/bboe/m/test",
+                "subreddits": [{"name": "redditdev"}],
+            },
+        )
+        multireddit._author._fetched = True
+        assert multireddit.subreddits == ["redditdev"]
+        multireddit._fetched = True
+        with pytest.raises(RuntimeError):
+            await multireddit.add_many(["redditdev", "test"])
+        assert "subreddits" not in multireddit.__dict__
+        assert not multireddit._fetched
+
+    @mock.patch("asyncpraw.Reddit.delete", new_callable=mock.CoroutineMock)
+    async def test_remove_many(self, mock_delete):
+        multireddit = self._multireddit()
+        multireddit._author._fetched = True
+        await multireddit.remove_many(["redditdev", "test"])
+        assert mock_delete.call_count == 2
+        mock_delete.assert_any_call(
+            "api/multi/user/bboe/m/test/r/test",
+            data={"model": '{"name":"test"}'},
+        )
+        assert not multireddit._fetched
+
+    @mock.patch("asyncpraw.Reddit.put", new_callable=mock.CoroutineMock)
+    async def test_update__subreddits(self, mock_put):
+        multireddit = self._multireddit()
+        multireddit._author._fetched = True
+        mock_put.return_value = self._multireddit()
+        await multireddit.update(
+            subreddits=["redditdev", Subreddit(self.reddit, "test"), {"name": "foo"}]
+        )
+        mock_put.assert_called_once_with(
+            "api/multi/user/bboe/m/test/",
+            data={
+                "model": '{"subreddits":[{"name":"redditdev"},{"name":"test"},'
+                '{"name":"foo"}]}'
+            },
+        )
+
+    @mock.patch("asyncpraw.Reddit.post", new_callable=mock.CoroutineMock)
+    @mock.patch("asyncpraw.models.User.me", new_callable=mock.CoroutineMock)
+    async def test_copy(self, mock_me, mock_post):
+        multireddit = self._multireddit()
+        mock_me.return_value = "spez"
+
+        async def load():
+            multireddit.display_name = "Test"
+            multireddit._fetched = True
+
+        with mock.patch.object(multireddit, "load", load):
+            await multireddit.copy()
+        mock_post.assert_called_once_with(
+            "api/multi/copy/",
+            data={
+                "display_name": "Test",
+                "from": "/user/bboe/m/test",
+                "to": "user/spez/m/test/",
+            },
+        )
@@ -1,6 +1,10 @@
+import asyncio
+
 import pytest
+from asynctest import mock
 
-from asyncpraw.models import Redditor
+from asyncpraw.models import Redditor, Subreddit, UserSubreddit
+from asyncpraw.models.reddit.redditor import _SharedListing
 
 from ... import UnitTest
 
@@ -53,6 +57,60 @@ class TestRedditor(UnitTest):
         with pytest.raises(ValueError):
             Redditor(self.reddit, fullname="")
 
+    async def test_fetch__updates_in_place(self):
+        redditor = Redditor(self.reddit, "spez")
+        data = {
+            "data": {
+                "id": "1w72",
+                "name": "spez",
+                "subreddit": {"display_name": "u_spez", "name": "t5_3k30p"},
+            }
+        }
+        with mock.patch.object(
+            redditor, "_fetch_data", mock.CoroutineMock(return_value=data)
+        ):
+            await redditor._fetch()
+        assert redditor._fetched
+        assert redditor.id == "1w72"
+        assert isinstance(redditor.subreddit, UserSubreddit)
+
+    @mock.patch("asyncpraw.Reddit.get", new_callable=mock.CoroutineMock)
+    async def test_fetch_username__batches_concurrent_calls(self, mock_get):
+        mock_get.return_value = {"t2_a": {"name": "a"}, "t2_b": {"name": "b"}}
+        redditors = [
+            Redditor(self.reddit, fullname=fullname)
+            for fullname in ("t2_a", "t2_b", "t2_a")
+        ]
+        names = await asyncio.gather(
+            *(redditor._fetch_username(redditor._fullname) for redditor in redditors)
+        )
+        assert names == ["a", "b", "a"]
+        mock_get.assert_called_once_with(
+            "/api/user_data_by_account_ids", params={"ids": "t2_a,t2_b"}
+        )
+
+    @mock.patch("asyncpraw.Reddit.get", new_callable=mock.CoroutineMock)
+    async def test_fetch_username__missing(self, mock_get):
+        mock_get.return_value = {"t2_a": {"name": "a"}}
+        redditor = Redditor(self.reddit, fullname="t2_b")
+        with pytest.raises(KeyError):
+            await redditor._fetch_username("t2_b")
+
+    @mock.patch("asyncpraw.Reddit.get", new_callable=mock.CoroutineMock)
+    async def test_fetch_username__request_failure(self, mock_get):
+        mock_get.side_effect = RuntimeError("request failed")
+        redditors = [
+            Redditor(self.reddit, fullname=fullname) for fullname in ("t2_a", "t2_b")
+        ]
+        results = await asyncio.gather(
+            *(redditor._fetch_username(redditor._fullname) for redditor in redditors),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+        mock_get.assert_called_once_with(
+            "/api/user_data_by_account_ids", params={"ids": "t2_a,t2_b"}
+        )
+
     def test_fullname(self):
         redditor = Redditor(self.reddit, _data={"name": "name", "id": "dummy"})
         assert redditor.fullname == "t2_dummy"
@@ -78,14 +136,108 @@ class TestRedditor(UnitTest):
         assert hash(redditor2) != hash(redditor3)
         assert hash(redditor1) != hash(redditor3)
 
+    @mock.patch("asyncpraw.Reddit.post", new_callable=mock.CoroutineMock)
+    async def test_message_many(self, mock_post):
+        targets = [Redditor(self.reddit, "spez"), Subreddit(self.reddit, "test")]
+        await Redditor.message_many(targets, "subject", "message")
+        assert mock_post.call_count == 2
+        mock_post.assert_any_call(
+            "api/compose/",
+            data={"subject": "subject", "text": "message", "to": "spez"},
+        )
+        mock_post.assert_any_call(
+            "api/compose/",
+            data={"subject": "subject", "text": "message", "to": "#test"},
+        )
+
+    def test_path__cached(self):
+        redditor = Redditor(self.reddit, "spez")
+        assert redditor._path == "user/spez/"
+        assert redditor.__dict__["_path"] == "user/spez/"
+        redditor.name = "Spez"
+        assert redditor._path == "user/Spez/"
+
+    async def test_profile_bundle(self):
+        redditor = Redditor(self.reddit, "spez")
+        with mock.patch.multiple(
+            redditor,
+            moderated=mock.CoroutineMock(return_value=["moderated"]),
+            multireddits=mock.CoroutineMock(return_value=["multireddit"]),
+            trophies=mock.CoroutineMock(return_value=["trophy"]),
+        ):
+            assert await redditor.profile_bundle() == (
+                ["moderated"],
+                ["multireddit"],
+                ["trophy"],
+            )
+
     def test_repr(self):
         redditor = Redditor(self.reddit, name="RedditorName")
         assert repr(redditor) == "Redditor(name='RedditorName')"
 
+    async def test_stream__shares_listing_response(self):
+        redditor = Redditor(self.reddit, "spez")
+        calls = []
+
+        async def new(**kwargs):
+            calls.append(kwargs)
+            for item in ("a", "b"):
+                yield item
+
+        with mock.patch.object(redditor.comments, "new", new):
+            redditor.stream.comments()
+            listing = redditor.stream._comments_new
+
+            async def consume():
+                return [item async for item in listing(limit=100)]
+
+            assert await asyncio.gather(consume(), consume()) == [
+                ["a", "b"],
+                ["a", "b"],
+            ]
+            assert [item async for item in listing(limit=99)] == ["a", "b"]
+        assert calls == [{"limit": 100}, {"limit": 99}]
+
+    async def test_stream__shared_listing_expires(self):
+        calls = []
+
+        async def new(**kwargs):
+            calls.append(kwargs)
+            yield len(calls)
+
+        listing = _SharedListing(new, ttl=0)
+        assert [item async for item in listing(limit=100)] == [1]
+        assert [item async for item in listing(limit=99)] == [2]
+        assert [item async for item in listing(limit=100)] == [3]
+        assert len(listing._responses) == 1
+
+    async def test_stream__shared_listing_failure_not_shared(self):
+        calls = []
+
+        async def new(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                raise RuntimeError
+            yield "a"
+
+        listing = _SharedListing(new)
+        with pytest.raises(RuntimeError):
+            [item async for item in listing(limit=100)]
+        assert not listing._responses
+        assert [item async for item in listing(limit=100)] == ["a"]
+        assert len(calls) == 2
+
     def test_str(self):
         redditor = Redditor(self.reddit, _data={"name": "name", "id": "dummy"})
         assert str(redditor) == "name"
 
+    def test_user_path(self):
+        redditor = Redditor(self.reddit, "spez")
+        assert redditor._user_path("trophies") == "api/v1/user/spez/trophies"
+        assert redditor._user_path("trophies") is redditor._user_path("trophies")
+        redditor.name = "Spez"
+        assert redditor._user_path("trophies") == "api/v1/user/Spez/trophies"
+
 
 class TestRedditorListings(UnitTest):
     def test__params_not_modified_in_mixed_listing(self):
@@ -1,5 +1,9 @@
+import asyncio
+
 import pytest
+from asynctest import mock
 
+from asyncpraw.exceptions import ClientException
 from asyncpraw.models import Rule, Subreddit
 
 from ... import UnitTest
@@ -10,6 +14,105 @@ class TestRules(UnitTest):
     def subreddit(self):
         return Subreddit(self.reddit, display_name=pytest.placeholders.test_subreddit)
 
+    def rule_list(self, *names):
+        return [Rule(self.reddit, _data={"short_name": name}) for name in names]
+
+    async def test_rule_list__cached(self):
+        subreddit = self.subreddit
+        get = mock.CoroutineMock(return_value=self.rule_list("a", "b"))
+        with mock.patch.object(self.reddit, "get", get):
+            assert (await subreddit.rules.get_rule(0)).short_name == "a"
+            assert [rule.short_name async for rule in subreddit.rules] == ["a", "b"]
+            assert get.call_count == 1
+            await subreddit.rules._rule_list(force=True)
+            assert get.call_count == 2
+
+    async def test_get_rule__by_name(self):
+        subreddit = self.subreddit
+        get = mock.CoroutineMock(return_value=self.rule_list("a", "b"))
+        with mock.patch.object(self.reddit, "get", get):
+            assert (await subreddit.rules.get_rule("b")).short_name == "b"
+            with pytest.raises(ClientException):
+                await subreddit.rules.get_rule("c")
+            assert get.call_count == 1
+
+    async def test_load__refetches(self):
+        subreddit = self.subreddit
+        updated = Rule(self.reddit, _data={"short_name": "a", "description": "new"})
+        get = mock.CoroutineMock(side_effect=[self.rule_list("a"), [updated]])
+        with mock.patch.object(self.reddit, "get", get):
+            rule = await subreddit.rules.get_rule("a")
+            await rule.load()
+        assert get.call_count == 2
+        assert rule.description == "new"
+
+    async def test_rule_list__concurrent(self):
+        subreddit = self.subreddit
+        get = mock.CoroutineMock(return_value=self.rule_list("a", "b"))
+        with mock.patch.object(self.reddit, "get", get):
+            rules = await asyncio.gather(
+                subreddit.rules.get_rule("a"),
+                subreddit.rules.get_rule("b"),
+                subreddit.rules.get_rule(0),
+            )
+        assert [rule.short_name for rule in rules] == ["a", "b", "a"]
+        assert get.call_count == 1
+        assert subreddit.rules._inflight is None
+
+    async def test_rule_list__concurrent_failure(self):
+        subreddit = self.subreddit
+        get = mock.CoroutineMock(side_effect=[RuntimeError, self.rule_list("a")])
+        with mock.patch.object(self.reddit, "get", get):
+            results = await asyncio.gather(
+                subreddit.rules._rule_list(),
+                subreddit.rules._rule_list(),
+                return_exceptions=True,
+            )
+            assert all(isinstance(result, RuntimeError) for result in results)
+            assert len(await subreddit.rules._rule_list()) == 1
+        assert get.call_count == 2
+
+    async def test_get_rule__cache_cleared_during_request(self):
+        subreddit = self.subreddit
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def get(*args, **kwargs):
+            started.set()
+            await release.wait()
+            return self.rule_list("a", "b")
+
+        with mock.patch.object(self.reddit, "get", get):
+            pending = asyncio.ensure_future(subreddit.rules.get_rule("b"))
+            await started.wait()
+            subreddit.rules._clear_cache()
+            release.set()
+            rule = await pending
+        assert rule.short_name == "b"
+        assert subreddit.rules._cached_rules is None
+        assert not subreddit.rules._rules_by_name
+
+    async def test_rule_list__expired(self):
+        subreddit = self.subreddit
+        get = mock.CoroutineMock(return_value=self.rule_list("a"))
+        with mock.patch.object(self.reddit, "get", get):
+            await subreddit.rules._rule_list()
+            subreddit.rules._cache_ts -= subreddit.rules.CACHE_TTL
+            await subreddit.rules._rule_list()
+            assert get.call_count == 2
+
+    async def test_rule_list__cleared_by_mod(self):
+        subreddit = self.subreddit
+        get = mock.CoroutineMock(return_value=self.rule_list("a"))
+        post = mock.CoroutineMock(return_value=self.rule_list("b"))
+        with mock.patch.object(self.reddit, "get", get), mock.patch.object(
+            self.reddit, "post", post
+        ):
+            await subreddit.rules._rule_list()
+            await subreddit.rules.mod.add(short_name="b", kind="all")
+            await subreddit.rules._rule_list()
+            assert get.call_count == 2
+
     def test_empty_value(self):
         with pytest.raises(ValueError):
             Rule(self.reddit, self.subreddit, short_name="")
@@ -24,6 +127,13 @@ class TestRules(UnitTest):
             Rule(self.reddit, self.subreddit, short_name="test", _data={})
         assert excinfo.value.args[0] == "Either short_name or _data needs to be given."
 
+    def test_set_subreddit(self):
+        rule = Rule(self.reddit, short_name="test")
+        subreddit = self.subreddit
+        rule.subreddit = subreddit
+        assert rule.subreddit is subreddit
+        assert rule._subreddit is subreddit
+
     def test_no_subreddit(self):
         rule = Rule(self.reddit, short_name="test")
         with pytest.raises(ValueError) as excinfo:
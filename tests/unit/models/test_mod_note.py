@@ -0,0 +1,29 @@
+"""Test asyncpraw.models.ModNote."""
+from asyncpraw.models import ModNote, Redditor, Subreddit
+
+from .. import UnitTest
+
+
+class TestModNote(UnitTest):
+    def test_properties(self):
+        note = ModNote(
+            self.reddit,
+            _data={"operator": "mod", "subreddit": "test", "user": "spez"},
+        )
+        assert isinstance(note.user, Redditor)
+        assert isinstance(note.operator, Redditor)
+        assert isinstance(note.subreddit, Subreddit)
+        assert note.user.name == "spez"
+        assert note.operator.name == "mod"
+        assert note.subreddit.display_name == "test"
+
+    def test_properties__cached(self):
+        note = ModNote(self.reddit, _data={"user": "spez"})
+        assert note.user is note.user
+
+    def test_properties__setter_resets_cache(self):
+        note = ModNote(self.reddit, _data={"user": "spez"})
+        user = note.user
+        note.user = "bboe"
+        assert note.user is not user
+        assert note.user.name == "bboe"
@@ -1,10 +1,14 @@
 """Test asyncpraw.models.util."""
+import asyncio
 from collections import namedtuple
 from unittest import mock
 
+import pytest
+
 from asyncpraw.models.util import (
     BoundedSet,
     ExponentialCounter,
+    _gather_bounded,
     permissions_string,
     stream_generator,
 )
@@ -75,6 +79,52 @@ class TestBoundedSet(UnitTest):
         assert 1 not in bset
 
 
+class TestGatherBounded(UnitTest):
+    async def test_gather_bounded(self):
+        active = []
+        peak = []
+
+        async def work(item):
+            active.append(item)
+            peak.append(len(active))
+            # Let the other items run before this one finishes
+            yielded = asyncio.get_running_loop().create_future()
+            asyncio.get_running_loop().call_soon(yielded.set_result, None)
+            await yielded
+            active.remove(item)
+            return item * 2
+
+        assert await _gather_bounded(work, [1, 2, 3, 4, 5], 2) == [2, 4, 6, 8, 10]
+        assert max(peak) == 2
+
+    async def test_gather_bounded__failure(self):
+        finished = []
+
+        async def work(item):
+            if item == 1:
+                raise RuntimeError(item)
+            # Let the failing item finish before this one does
+            yielded = asyncio.get_running_loop().create_future()
+            asyncio.get_running_loop().call_soon(yielded.set_result, None)
+            await yielded
+            finished.append(item)
+
+        with pytest.raises(RuntimeError):
+            await _gather_bounded(work, [1, 2, 3], 3)
+        assert finished == [2, 3]
+
+    async def test_gather_bounded__invalid_max_concurrency(self):
+        work = mock.Mock()
+        for value in (0, -1):
+            with pytest.raises(ValueError) as excinfo:
+                await _gather_bounded(work, [1, 2], value)
+            assert str(excinfo.value) == (
+                "An incorrect value was given for max_concurrency. The value must be at"
+                f" least 1, but the given value is {value}."
+            )
+        assert work.call_count == 0
+
+
 class TestStream(UnitTest):
     @mock.patch("asyncio.sleep", return_value=None)
     async def test_stream(self, _):
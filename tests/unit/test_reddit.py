@@ -1,3 +1,4 @@
+import asyncio
 import configparser
 import types
 
@@ -102,6 +103,24 @@ class TestReddit(UnitTest):
             " expected type is int, but the given value is test."
         )
 
+    def test_invalid_config__max_concurrent_requests(self):
+        with pytest.raises(ValueError) as excinfo:
+            Reddit(max_concurrent_requests="test", **self.REQUIRED_DUMMY_SETTINGS)
+        assert (
+            excinfo.value.args[0]
+            == "An incorrect config type was given for option max_concurrent_requests."
+            " The expected type is int, but the given value is test."
+        )
+        for value in (0, -1):
+            with pytest.raises(ValueError) as excinfo:
+                Reddit(max_concurrent_requests=value, **self.REQUIRED_DUMMY_SETTINGS)
+            assert (
+                excinfo.value.args[0]
+                == "An incorrect config value was given for option"
+                " max_concurrent_requests. The value must be at least 1, but the given"
+                f" value is {value}."
+            )
+
     def test_info__not_list(self):
         with pytest.raises(TypeError) as excinfo:
             self.reddit.info("Let's try a string")
@@ -453,6 +472,32 @@ class TestReddit(UnitTest):
             await reddit.request("POST", "/")
         assert str(excinfo.value) == "received 400 HTTP response"
 
+    @mock.patch("asyncprawcore.sessions.Session")
+    async def test_request__max_concurrent_requests(self, mock_session):
+        active = []
+        peak = []
+        release = asyncio.Event()
+
+        async def request(*args, **kwargs):
+            active.append(None)
+            peak.append(len(active))
+            if len(active) == 2:
+                release.set()
+            await release.wait()
+            active.pop()
+            return {}
+
+        mock_session.return_value.request = request
+        reddit = Reddit(
+            client_id="dummy",
+            client_secret="dummy",
+            max_concurrent_requests=2,
+            user_agent="dummy",
+        )
+        await asyncio.gather(*(reddit.request("GET", "/") for _ in range(5)))
+        assert max(peak) == 2
+        assert len(peak) == 5
+
     async def test_request__json_and_body(self):
         reddit = Reddit(client_id="dummy", client_secret="dummy", user_agent="dummy")
         with pytest.raises(ClientException) as excinfo:
@@ -0,0 +1,51 @@
+"""Test asyncpraw.util.serializer."""
+import importlib
+import sys
+from contextlib import contextmanager
+from json import loads as json_loads
+
+from asynctest import mock
+
+from asyncpraw.util import serializer
+from asyncpraw.util.serializer import dumps, loads
+
+from .. import UnitTest
+
+
+@contextmanager
+def json_serializer():
+    """Provide the serializer module as loaded when orjson is not installed."""
+    try:
+        with mock.patch.dict(sys.modules, {"orjson": None}):
+            yield importlib.reload(serializer)
+    finally:
+        importlib.reload(serializer)
+
+
+class TestDumps(UnitTest):
+    def test_dumps(self):
+        data = {"name": "spez", "note": None, "subreddits": [{"name": "test"}]}
+        result = dumps(data)
+        assert isinstance(result, str)
+        assert json_loads(result) == data
+
+    def test_dumps__compact(self):
+        assert dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+
+    def test_dumps__without_orjson(self):
+        with json_serializer() as module:
+            assert module.dumps is not dumps
+            assert module.dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+
+
+class TestLoads(UnitTest):
+    def test_loads(self):
+        data = '[{"short_name": "No spam", "priority": 0, "description": null}]'
+        assert loads(data) == json_loads(data)
+        assert loads(data.encode()) == json_loads(data)
+
+    def test_loads__without_orjson(self):
+        data = '{"rules": [{"short_name": "No spam"}]}'
+        with json_serializer() as module:
+            assert module.loads is json_loads
+            assert module.loads(data) == {"rules": [{"short_name": "No spam"}]}